@@ -15,21 +15,23 @@ from src.churn_ml.etl.customer_churn_etl import CustomerChurnETL
 from src.churn_ml.utils.exceptions import CustomerChurnException
 from src.churn_ml.utils.logging import logging
 
+logger = logging.getLogger(__name__)
+
 
 def main() -> None:
     """
     Orchestrate execution of the customer churn ETL pipeline.
     """
     try:
-        logging.info("ETL job started")
+        logger.info("ETL job started")
 
         etl = CustomerChurnETL()
         etl.run_etl()
 
-        logging.info("ETL job finished successfully")
+        logger.info("ETL job finished successfully")
 
     except Exception as e:
-        logging.critical("ETL job failed", exc_info=True)
+        logger.critical("ETL job failed", exc_info=True)
         raise CustomerChurnException(e, sys)
 
 
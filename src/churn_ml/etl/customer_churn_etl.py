@@ -9,16 +9,45 @@ This module is responsible for:
 Designed for batch execution and repeatable ingestion.
 """
 
+import atexit
 import os
+import shutil
 import sys
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import certifi
 import pandas as pd
-import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import pymongo
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 import kagglehub
+from bson import encode
+from bson.raw_bson import RawBSONDocument
 from dotenv import load_dotenv
 
 from src.churn_ml.utils.logging import logging
@@ -26,6 +55,203 @@ from src.churn_ml.utils.exceptions import CustomerChurnException
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Resolved once per process; certifi.where() touches the filesystem
+_CA_FILE = certifi.where()
+
+# Suffix of the collection each run loads into before replacing the live one
+STAGING_SUFFIX = "_staging"
+
+# Marker file written once a dataset has been fully cached locally
+CACHE_READY_MARKER = ".ready"
+
+# Default number of CSV rows parsed and loaded per ETL iteration
+DEFAULT_CHUNKSIZE = 50_000
+
+# Decimal number pattern; anything else in TotalCharges is coerced to null
+NUMERIC_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+# Bytes handed to each pyarrow CSV parser block
+CSV_BLOCK_SIZE = 16 << 20
+
+# Explicit Arrow types for columns whose inferred type is unreliable
+CSV_COLUMN_TYPES = {
+    "SeniorCitizen": pa.int8(),
+    "TotalCharges": pa.string(),
+}
+
+# Default number of documents sent per bulk_write round-trip
+DEFAULT_BATCH_SIZE = 1_000
+
+# Default number of threads issuing bulk_write batches concurrently
+DEFAULT_INSERT_WORKERS = 16
+
+# Batches allowed in flight per insert worker before encoding pauses
+IN_FLIGHT_BATCHES_PER_WORKER = 2
+
+# Upper bound on pooled MongoDB connections shared by insert workers
+MONGO_MAX_POOL_SIZE = 64
+
+# MongoDB error code raised on unique index violations
+DUPLICATE_KEY_ERROR = 11000
+
+
+@lru_cache(maxsize=None)
+def _make_encoder(
+    columns: Tuple[str, ...]
+) -> Callable[[List[List[Any]], int], Dict[str, Any]]:
+    """
+    Generate a row encoder specialized for a fixed column layout.
+
+    The generated function builds each document from a dict literal with
+    constant keys, e.g. ``{"customerID": arrs[0][i], ...}``, instead of
+    looping over column names for every row.
+    """
+    fields = ", ".join(
+        f"{column!r}: arrs[{index}][i]" for index, column in enumerate(columns)
+    )
+    source = f"def enc(arrs, i):\n    return {{{fields}}}\n"
+
+    namespace: Dict[str, Any] = {}
+    code = compile(source, f"<encoder:{len(columns)} columns>", "exec")
+    exec(code, namespace)
+    return namespace["enc"]
+
+
+def _iter_records(table: pa.Table) -> Iterator[RawBSONDocument]:
+    """
+    Lazily yield one pre-encoded MongoDB document per table row.
+
+    Columns are exported once as lists of native Python values
+    (missing values become ``None``), avoiding the intermediate
+    list of dicts built by ``DataFrame.to_dict(orient="records")``.
+    Each row is encoded to BSON exactly once; the driver sends
+    ``RawBSONDocument`` bytes without re-encoding them.
+    """
+    arrs = [column.to_pylist() for column in table.columns]
+    enc = _make_encoder(tuple(table.column_names))
+
+    for i in range(table.num_rows):
+        yield RawBSONDocument(encode(enc(arrs, i)))
+
+
+def _iter_tables(
+    reader: pacsv.CSVStreamingReader, size: int
+) -> Iterator[pa.Table]:
+    """
+    Regroup the record batches of a streaming CSV reader into tables
+    of exactly ``size`` rows (the final table may be shorter).
+    """
+    buffered: List[pa.RecordBatch] = []
+    buffered_rows = 0
+
+    for batch in reader:
+        buffered.append(batch)
+        buffered_rows += batch.num_rows
+
+        while buffered_rows >= size:
+            table = pa.Table.from_batches(buffered, schema=reader.schema)
+            yield table.slice(0, size)
+
+            remainder = table.slice(size)
+            buffered = remainder.to_batches()
+            buffered_rows = remainder.num_rows
+
+    if buffered_rows:
+        yield pa.Table.from_batches(buffered, schema=reader.schema)
+
+
+def _batched(
+    records: Iterable[RawBSONDocument], size: int
+) -> Iterator[List[RawBSONDocument]]:
+    """
+    Split an iterable of records into lists of at most ``size`` items.
+    """
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@dataclass(frozen=True, slots=True)
+class _Cfg:
+    """
+    Immutable ETL settings resolved from environment variables.
+    """
+
+    mongodb_url: Optional[str]
+    data_source: Optional[str]
+    database: Optional[str]
+    collection: Optional[str]
+    ca_file: str
+    chunksize: int
+    batch_size: int
+    insert_workers: int
+    fast_insert: bool
+    data_cache_dir: Optional[str]
+    force_refresh: bool
+
+    @classmethod
+    def from_env(cls) -> "_Cfg":
+        """
+        Build the configuration from the current process environment.
+        """
+        return cls(
+            mongodb_url=os.getenv("MONGODB_URL"),
+            data_source=os.getenv("DATA_SOURCE"),
+            database=os.getenv("MONGODB_DATABASE"),
+            collection=os.getenv("MONGODB_COLLECTION"),
+            ca_file=_CA_FILE,
+            chunksize=int(os.getenv("ETL_CHUNKSIZE", DEFAULT_CHUNKSIZE)),
+            batch_size=int(os.getenv("ETL_BATCH_SIZE", DEFAULT_BATCH_SIZE)),
+            insert_workers=int(
+                os.getenv("ETL_INSERT_WORKERS", DEFAULT_INSERT_WORKERS)
+            ),
+            fast_insert=os.getenv("ETL_FAST_INSERT") == "1",
+            data_cache_dir=os.getenv("DATA_CACHE_DIR"),
+            force_refresh=os.getenv("FORCE_REFRESH") == "1",
+        )
+
+
+_clients: Dict[str, pymongo.MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_mongo_client(mongodb_url: Optional[str] = None) -> pymongo.MongoClient:
+    """
+    Return the shared MongoDB client for a connection string, creating
+    it on first use. Defaults to the current ``MONGODB_URL``.
+
+    The client owns a thread-safe connection pool, so reusing it avoids
+    repeating the TLS handshake and topology discovery on every load.
+    Clients are keyed by URL, so a corrected environment takes effect
+    without restarting the interpreter.
+    """
+    mongodb_url = mongodb_url or os.getenv("MONGODB_URL")
+    if not mongodb_url:
+        raise ValueError("MONGODB_URL is not set in the environment variables")
+
+    with _clients_lock:
+        client = _clients.get(mongodb_url)
+        if client is None:
+            client = pymongo.MongoClient(
+                mongodb_url,
+                tlsCAFile=_CA_FILE,
+                maxPoolSize=MONGO_MAX_POOL_SIZE,
+                serverSelectionTimeoutMS=5000,
+            )
+            _clients[mongodb_url] = client
+    return client
+
+
+@atexit.register
+def _close_mongo_clients() -> None:
+    """
+    Close the shared MongoDB clients at interpreter shutdown.
+    """
+    for client in _clients.values():
+        client.close()
+
 
 class CustomerChurnETL:
     """
@@ -38,17 +264,13 @@ class CustomerChurnETL:
         and validate required settings.
         """
         try:
-            self.mongodb_url: str = os.getenv("MONGODB_URL")
-            self.data_source: str = os.getenv("DATA_SOURCE")
-            self.database: str = os.getenv("MONGODB_DATABASE")
-            self.collection: str = os.getenv("MONGODB_COLLECTION")
-            self.ca_file: str = certifi.where()
+            self.cfg: _Cfg = _Cfg.from_env()
 
             self._validate_env()
-            logging.info("ETL initialized successfully")
+            logger.info("ETL initialized successfully")
 
         except Exception as e:
-            logging.error("ETL initialization failed", exc_info=True)
+            logger.error("ETL initialization failed", exc_info=True)
             raise CustomerChurnException(e, sys)
 
     def _validate_env(self) -> None:
@@ -56,10 +278,10 @@ class CustomerChurnETL:
         Validate presence of required environment variables.
         """
         required_vars = {
-            "MONGODB_URL": self.mongodb_url,
-            "DATA_SOURCE": self.data_source,
-            "MONGODB_DATABASE": self.database,
-            "MONGODB_COLLECTION": self.collection,
+            "MONGODB_URL": self.cfg.mongodb_url,
+            "DATA_SOURCE": self.cfg.data_source,
+            "MONGODB_DATABASE": self.cfg.database,
+            "MONGODB_COLLECTION": self.cfg.collection,
         }
 
         missing = [key for key, value in required_vars.items() if not value]
@@ -68,129 +290,362 @@ class CustomerChurnETL:
                 f"Missing required environment variables: {', '.join(missing)}"
             )
 
-    def extract_data(self) -> pd.DataFrame:
+        if self.cfg.chunksize <= 0:
+            raise ValueError("ETL_CHUNKSIZE must be a positive integer")
+
+        if self.cfg.batch_size <= 0:
+            raise ValueError("ETL_BATCH_SIZE must be a positive integer")
+
+        if self.cfg.insert_workers <= 0:
+            raise ValueError("ETL_INSERT_WORKERS must be a positive integer")
+
+    def _download_dataset(self) -> Path:
+        """
+        Download the dataset through kagglehub, re-fetching it from Kaggle
+        when a refresh is forced.
+        """
+        return Path(
+            kagglehub.dataset_download(
+                self.cfg.data_source,
+                force_download=self.cfg.force_refresh,
+            )
+        )
+
+    def _resolve_dataset_dir(self) -> Path:
+        """
+        Return the local dataset directory, downloading it only when
+        the ``DATA_CACHE_DIR`` copy is missing or a refresh is forced.
+
+        ``FORCE_REFRESH=1`` also bypasses kagglehub's own local cache.
+        """
+        if not self.cfg.data_cache_dir:
+            return self._download_dataset()
+
+        cache_dir = Path(self.cfg.data_cache_dir) / self.cfg.data_source
+        ready_marker = cache_dir / CACHE_READY_MARKER
+
+        if ready_marker.exists() and not self.cfg.force_refresh:
+            logger.info("Using cached dataset | path=%s", cache_dir)
+            return cache_dir
+
+        download_dir = self._download_dataset()
+
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+        shutil.copytree(download_dir, cache_dir)
+        ready_marker.touch()
+
+        logger.info("Dataset cached | path=%s", cache_dir)
+        return cache_dir
+
+    def extract_data(self) -> Iterator[pd.DataFrame]:
         """
-        Download and load raw churn data into a DataFrame.
+        Download raw churn data and stream it as Arrow-backed
+        DataFrame chunks of at most ``chunksize`` rows.
         """
         try:
-            logging.info("Starting data extraction")
+            logger.info("Starting data extraction")
 
-            dataset_dir = Path(kagglehub.dataset_download(self.data_source))
+            dataset_dir = self._resolve_dataset_dir()
             csv_files = list(dataset_dir.glob("*.csv"))
 
             if len(csv_files) != 1:
                 raise ValueError("Expected exactly one CSV file in dataset directory")
 
-            df = pd.read_csv(csv_files[0])
+            # Streaming block parser producing Arrow columns; always
+            # single-threaded, but keeps memory bounded by the chunk size
+            reader = pacsv.open_csv(
+                csv_files[0],
+                read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=CSV_COLUMN_TYPES
+                ),
+            )
 
-            if df.empty:
+            total_rows = 0
+            with reader:
+                for table in _iter_tables(reader, self.cfg.chunksize):
+                    total_rows += table.num_rows
+                    yield table.to_pandas(types_mapper=pd.ArrowDtype)
+
+            if total_rows == 0:
                 raise ValueError("Extracted dataset is empty")
 
-            logging.info("Data extraction completed successfully")
-            return df
+            logger.info(
+                "Data extraction completed successfully | rows=%d",
+                total_rows,
+            )
 
         except Exception as e:
-            logging.error("Data extraction failed", exc_info=True)
+            logger.error("Data extraction failed", exc_info=True)
             raise CustomerChurnException(e, sys)
 
-    def transform_data(self, df: pd.DataFrame) -> List[Dict]:
+    def transform_data(self, df: pd.DataFrame) -> Iterable[RawBSONDocument]:
         """
         Apply lightweight transformations and convert data
         into MongoDB-ready records.
+
+        ``SeniorCitizen`` is stored as a BSON boolean (``true`` for 1)
+        and ``TotalCharges`` as a double, with blanks stored as null.
         """
         try:
-            logging.info("Starting data transformation")
+            logger.info("Starting data transformation")
 
             if df.empty:
-                raise ValueError("Cannot transform an empty DataFrame")
-
-            # Ensure one record per customer
-            df = df.drop_duplicates(subset=["customerID"], keep="first")
-
-            # Normalize binary categorical field
-            df["SeniorCitizen"] = df["SeniorCitizen"].map({1: "Yes", 0: "No"})
-
-            # Clean and coerce monetary column
-            df["TotalCharges"] = (
-                df["TotalCharges"]
-                .astype(str)
-                .str.strip()
-                .replace("", np.nan)
-            )
-
-            df["TotalCharges"] = pd.to_numeric(
-                df["TotalCharges"], errors="coerce"
+                logger.warning("Transform skipped | reason=empty_chunk")
+                return []
+
+            # Zero-copy for the Arrow-backed frames produced by extract_data
+            table = pa.Table.from_pandas(df, preserve_index=False)
+
+            # Ensure one record per customer; filter the Arrow table so
+            # the DataFrame itself is never sliced or copied
+            duplicated = df["customerID"].duplicated(keep="first").to_numpy()
+            duplicate_count = int(duplicated.sum())
+            if duplicate_count:
+                logger.warning(
+                    "Duplicate customers dropped | duplicates=%d",
+                    duplicate_count,
+                )
+                table = table.filter(pa.array(~duplicated))
+
+            # Store binary flag as a 1-byte BSON bool
+            senior_citizen = pc.equal(table["SeniorCitizen"], 1)
+
+            # Coerce monetary column; blank or non-numeric strings become null
+            total_charges = pc.utf8_trim_whitespace(
+                table["TotalCharges"].cast(pa.string())
             )
-
-            records = df.to_dict(orient="records")
-
-            logging.info(
+            total_charges = pc.if_else(
+                pc.match_substring_regex(total_charges, NUMERIC_PATTERN),
+                total_charges,
+                pa.scalar(None, pa.string()),
+            ).cast(pa.float64())
+
+            # Swap both columns in place, preserving column order
+            for name, column in (
+                ("SeniorCitizen", senior_citizen),
+                ("TotalCharges", total_charges),
+            ):
+                index = table.schema.get_field_index(name)
+                table = table.set_column(index, name, column)
+
+            records = _iter_records(table)
+
+            logger.info(
                 "Data transformation completed | records=%d",
-                len(records),
+                table.num_rows,
             )
             return records
 
         except Exception as e:
-            logging.error("Data transformation failed", exc_info=True)
+            logger.error("Data transformation failed", exc_info=True)
             raise CustomerChurnException(e, sys)
 
-    def load_data(self, records: List[Dict]) -> int:
+    def reset_collection(self, collection_name: Optional[str] = None) -> None:
         """
-        Insert transformed records into MongoDB.
+        Drop a collection (the configured one by default) and enforce
+        customer-level uniqueness before a full reload.
+
+        The unique index is built up front, on the empty collection, because
+        chunked loads rely on it to reject customers repeated across chunks.
         """
         try:
-            if not records:
-                logging.warning("Load skipped | reason=no_records")
-                return 0
+            client = get_mongo_client(self.cfg.mongodb_url)
+            collection = client[self.cfg.database][
+                collection_name or self.cfg.collection
+            ]
 
-            logging.info("Starting data load to MongoDB")
+            # Metadata-only drop instead of deleting documents one by one
+            collection.drop()
 
-            client = pymongo.MongoClient(
-                self.mongodb_url,
-                tlsCAFile=self.ca_file,
-                serverSelectionTimeoutMS=5000,
+            # Enforce customer-level uniqueness
+            collection.create_index("customerID", unique=True)
+
+        except Exception as e:
+            logger.error("Collection reset failed", exc_info=True)
+            raise CustomerChurnException(e, sys)
+
+    def promote_collection(self, staging_name: str) -> None:
+        """
+        Atomically replace the configured collection with a fully loaded
+        staging collection, carrying over its unique index.
+        """
+        try:
+            client = get_mongo_client(self.cfg.mongodb_url)
+            client[self.cfg.database][staging_name].rename(
+                self.cfg.collection, dropTarget=True
+            )
+            logger.info(
+                "Staging collection promoted | %s -> %s",
+                staging_name,
+                self.cfg.collection,
             )
 
-            db = client[self.database]
-            collection = db[self.collection]
+        except Exception as e:
+            logger.error("Collection promotion failed", exc_info=True)
+            raise CustomerChurnException(e, sys)
 
-            # temporary
-            collection.delete_many({})
+    def _drop_collection_quietly(self, collection_name: str) -> None:
+        """
+        Best-effort cleanup of a staging collection after a failed run.
+        """
+        try:
+            client = get_mongo_client(self.cfg.mongodb_url)
+            client[self.cfg.database].drop_collection(collection_name)
+        except Exception:
+            logger.warning(
+                "Staging cleanup failed | collection=%s",
+                collection_name,
+                exc_info=True,
+            )
 
-            # Enforce customer-level uniqueness
-            collection.create_index("customerID", unique=True)
+    @staticmethod
+    def _insert_batch(collection, batch: List[RawBSONDocument]) -> int:
+        """
+        Insert a single batch, skipping records whose customerID
+        already exists in the collection.
+        """
+        try:
+            result = collection.bulk_write(
+                [InsertOne(doc) for doc in batch], ordered=False
+            )
+            # Unacknowledged writes report no counts
+            if not result.acknowledged:
+                return len(batch)
+            return result.inserted_count
+        except BulkWriteError as bwe:
+            write_errors = bwe.details.get("writeErrors", [])
+            if any(
+                err.get("code") != DUPLICATE_KEY_ERROR
+                for err in write_errors
+            ):
+                raise
+            logger.warning(
+                "Duplicate records skipped | duplicates=%d",
+                len(write_errors),
+            )
+            return bwe.details.get("nInserted", 0)
 
-            result = collection.insert_many(records, ordered=False)
-            inserted_count = len(result.inserted_ids)
+    def load_data(
+        self,
+        records: Iterable[RawBSONDocument],
+        collection_name: Optional[str] = None,
+    ) -> int:
+        """
+        Insert transformed records into MongoDB (the configured
+        collection unless ``collection_name`` is given) in batches of
+        ``batch_size`` documents, dispatched concurrently across
+        ``insert_workers`` threads sharing one client. At most
+        ``IN_FLIGHT_BATCHES_PER_WORKER * insert_workers`` batches are
+        pending at once, so encoded documents are never materialized
+        for the whole chunk.
+
+        Records whose customerID already exists in the collection
+        (e.g. duplicates spread across CSV chunks) are skipped.
+        With ``ETL_FAST_INSERT=1`` writes are unacknowledged
+        (fire-and-forget): nothing confirms they were applied, duplicate
+        and other write errors go unreported, and the returned count is
+        only the number of documents sent.
+
+        Records are encoded lazily as batches are drawn, so BSON encoding
+        errors surface here rather than in ``transform_data``.
+        """
+        try:
+            logger.info(
+                "Starting data load to MongoDB | batch_size=%d workers=%d "
+                "fast_insert=%s",
+                self.cfg.batch_size,
+                self.cfg.insert_workers,
+                self.cfg.fast_insert,
+            )
 
-            client.close()
+            client = get_mongo_client(self.cfg.mongodb_url)
+            write_concern = WriteConcern(w=0) if self.cfg.fast_insert else None
+            collection = client[self.cfg.database].get_collection(
+                collection_name or self.cfg.collection,
+                write_concern=write_concern,
+            )
 
-            logging.info(
-                "Data load completed | inserted_records=%d",
+            max_in_flight = (
+                IN_FLIGHT_BATCHES_PER_WORKER * self.cfg.insert_workers
+            )
+            in_flight: Set[Future] = set()
+            sent_count = 0
+            inserted_count = 0
+
+            with ThreadPoolExecutor(
+                max_workers=self.cfg.insert_workers
+            ) as executor:
+                for batch in _batched(records, self.cfg.batch_size):
+                    # Sliding window: wait for a slot before encoding more
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(
+                            in_flight, return_when=FIRST_COMPLETED
+                        )
+                        inserted_count += sum(f.result() for f in done)
+
+                    sent_count += len(batch)
+                    in_flight.add(
+                        executor.submit(self._insert_batch, collection, batch)
+                    )
+
+                inserted_count += sum(f.result() for f in wait(in_flight).done)
+
+            if not sent_count:
+                logger.warning("Load skipped | reason=no_records")
+                return 0
+
+            if self.cfg.fast_insert:
+                logger.info(
+                    "Data load completed | sent_records=%d "
+                    "(unacknowledged, inserts not confirmed)",
+                    sent_count,
+                )
+                return sent_count
+
+            logger.info(
+                "Data load completed | sent_records=%d inserted_records=%d",
+                sent_count,
                 inserted_count,
             )
             return inserted_count
 
         except Exception as e:
-            logging.error("Data load failed", exc_info=True)
+            logger.error("Data load failed", exc_info=True)
             raise CustomerChurnException(e, sys)
 
     def run_etl(self) -> None:
         """
         Execute the full ETL pipeline.
+
+        Chunks are loaded into a staging collection that replaces the live
+        collection only after every chunk has loaded, so a failure at any
+        stage leaves the existing data untouched. With
+        ``ETL_FAST_INSERT=1`` unacknowledged writes may still be in flight
+        when the staging collection is promoted.
         """
+        staging_name = self.cfg.collection + STAGING_SUFFIX
+
         try:
-            logging.info("ETL pipeline started")
+            logger.info("ETL pipeline started")
+
+            self.reset_collection(staging_name)
+
+            inserted = 0
+            for chunk in self.extract_data():
+                records = self.transform_data(chunk)
+                inserted += self.load_data(records, staging_name)
 
-            df = self.extract_data()
-            records = self.transform_data(df)
-            inserted = self.load_data(records)
+            self.promote_collection(staging_name)
 
-            logging.info(
-                "ETL pipeline completed successfully | total_inserted=%d",
+            logger.info(
+                "ETL pipeline completed successfully | total_%s=%d",
+                "sent" if self.cfg.fast_insert else "inserted",
                 inserted,
             )
 
         except Exception as e:
-            logging.critical("ETL pipeline failed", exc_info=True)
+            logger.critical("ETL pipeline failed", exc_info=True)
+            self._drop_collection_quietly(staging_name)
             raise CustomerChurnException(e, sys)
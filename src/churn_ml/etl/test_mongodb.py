@@ -1,26 +1,28 @@
-import os
-from dotenv import load_dotenv
-from pymongo import MongoClient
-from pymongo.server_api import ServerApi
+"""
+Manual MongoDB connectivity check.
 
-# Load environment variables from .env
-load_dotenv()
+Run directly to ping the configured cluster. Importing this module does
+not connect, and the ETL module (with its .env loading, log-file setup
+and heavy imports) is only imported when the check runs.
+"""
 
-# Correct environment variable name
-MONGODB_URI = os.getenv("MONGODB_URL")
 
-if not MONGODB_URI:
-    raise ValueError("MONGODB_URL is not set in the environment variables")
+def main() -> None:
+    """
+    Validate the MongoDB connection with a ping.
+    """
+    # Imported lazily so module import stays free of ETL side effects
+    from src.churn_ml.etl.customer_churn_etl import get_mongo_client
 
-# Create MongoDB client
-client = MongoClient(
-    MONGODB_URI,
-    server_api=ServerApi("1")
-)
+    # Reuse the shared ETL client; raises if MONGODB_URL is not set
+    client = get_mongo_client()
 
-# Validate connection with a ping
-try:
-    client.admin.command("ping")
-    print("MongoDB connection established successfully.")
-except Exception as e:
-    raise ConnectionError("Failed to connect to MongoDB") from e
+    try:
+        client.admin.command("ping")
+        print("MongoDB connection established successfully.")
+    except Exception as e:
+        raise ConnectionError("Failed to connect to MongoDB") from e
+
+
+if __name__ == "__main__":
+    main()
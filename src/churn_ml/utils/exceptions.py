@@ -7,6 +7,8 @@ across pipelines, services, and APIs.
 """
 
 import sys
+import traceback
+
 from src.churn_ml.utils.logging import logging
 
 
@@ -33,12 +35,13 @@ class CustomerChurnException(Exception):
 
         _, _, exc_tb = error_details.exc_info()
 
-        if exc_tb is not None:
-            self.lineno = exc_tb.tb_lineno
-            self.file_name = exc_tb.tb_frame.f_code.co_filename
-        else:
-            self.lineno = None
-            self.file_name = None
+        # Copy location as plain values instead of reading tb_frame; the
+        # original exception (and its __traceback__) is still kept in
+        # error_message so chained tracebacks remain available
+        frame = traceback.extract_tb(exc_tb, limit=1)[0] if exc_tb else None
+
+        self.lineno = frame.lineno if frame else None
+        self.file_name = frame.filename if frame else None
 
     def __str__(self) -> str:
         """
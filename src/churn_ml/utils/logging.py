@@ -2,16 +2,23 @@
 Centralized logging configuration for the project.
 
 This module configures application-wide logging with:
-- Timestamped log files for traceability
+- Timestamped, size-capped rotating log files for traceability
 - A dedicated logs directory
 - A consistent log format suitable for debugging and monitoring
+- Non-blocking log calls: records are queued and written to disk by a
+  single background listener thread
 
-Intended to be imported once at application startup.
+Configuration is applied only if the root logger has no handlers yet,
+so importing or reloading this module more than once is a no-op.
+Modules should log through ``logging.getLogger(__name__)``.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Generate a unique log file name using the current timestamp
 LOG_FILE_NAME = datetime.now().strftime("%m_%d_%Y_%H_%M_%S") + ".log"
@@ -19,15 +26,34 @@ LOG_FILE_NAME = datetime.now().strftime("%m_%d_%Y_%H_%M_%S") + ".log"
 # Define the directory where log files will be stored
 LOGS_DIR = os.path.join(os.getcwd(), "logs")
 
-# Ensure the logs directory exists (idempotent operation)
-os.makedirs(LOGS_DIR, exist_ok=True)
-
 # Construct the absolute path to the log file
 LOG_FILE_PATH = os.path.join(LOGS_DIR, LOG_FILE_NAME)
 
-# Configure the root logger
-logging.basicConfig(
-    filename=LOG_FILE_PATH,
-    level=logging.INFO,
-    format="[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s",
-)
+# Rotate after 50 MB, keeping at most 5 backups per run
+LOG_MAX_BYTES = 50 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+LOG_FORMAT = "[%(asctime)s] %(lineno)d %(name)s - %(levelname)s - %(message)s"
+
+# Configure the root logger once per process
+_root_logger = logging.getLogger()
+
+if not _root_logger.handlers:
+    # Ensure the logs directory exists (idempotent operation)
+    os.makedirs(LOGS_DIR, exist_ok=True)
+
+    _file_handler = RotatingFileHandler(
+        LOG_FILE_PATH,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+    )
+    _file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Callers only enqueue; the listener thread owns all file I/O
+    _log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(_log_queue, _file_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    _root_logger.setLevel(logging.INFO)
+    _root_logger.addHandler(QueueHandler(_log_queue))